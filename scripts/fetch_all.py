@@ -3,19 +3,44 @@
 AI Digest - Fetch all sources and select top item per category.
 """
 
+import gzip
+import hashlib
+import heapq
+import io
 import json
 import os
+import pickle
 import sys
 import re
-import urllib.request
+import threading
+import time
+import zlib
 import urllib.parse
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
-from html import unescape
+from html.parser import HTMLParser
 import ssl
 import http.client
 
+# orjson's C parser is several times faster than stdlib json on the larger
+# payloads (HuggingFace listing, 50 HN stories); fall back when not installed
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None)
+
 # Disable SSL verification for some feeds
 ssl_context = ssl.create_default_context()
 
@@ -24,124 +49,370 @@ OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
 ssl_context.check_hostname = False
 ssl_context.verify_mode = ssl.CERT_NONE
 
+# Shared pool for overlapping network-bound fetches (feeds, APIs)
+FEEDS_POOL = ThreadPoolExecutor(max_workers=8)
+
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
-HISTORY_FILE = Path(__file__).parent.parent / "history.json"
+# History is partitioned one file per day under history/, so dedup only ever
+# reads the last HISTORY_DAYS files no matter how long the pipeline has run.
+# history.json is the legacy single-file store, split on first run.
+HISTORY_DIR = Path(__file__).parent.parent / "history"
+LEGACY_HISTORY_FILE = Path(__file__).parent.parent / "history.json"
 TODAY = datetime.now().strftime("%Y-%m-%d")
 HISTORY_DAYS = 7  # Don't repeat items from the last 7 days
+HISTORY_KEEP_DAYS = 30  # Prune per-day files older than this
+
+def _migrate_legacy_history():
+    """Split the old single-file history.json into per-day files (once)."""
+    if HISTORY_DIR.exists() or not LEGACY_HISTORY_FILE.exists():
+        return
+    try:
+        with open(LEGACY_HISTORY_FILE) as f:
+            legacy = json.load(f)
+    except:
+        return
+    HISTORY_DIR.mkdir(exist_ok=True)
+    for date, items in legacy.get("selections", {}).items():
+        with open(HISTORY_DIR / f"{date}.json", 'w') as f:
+            json.dump(items, f, indent=2)
 
-def load_history():
-    """Load history of previously selected items."""
-    if HISTORY_FILE.exists():
+def _load_day_selections(date):
+    """Load one day's selections, or {} if that day has none."""
+    path = HISTORY_DIR / f"{date}.json"
+    if path.exists():
         try:
-            with open(HISTORY_FILE) as f:
+            with open(path) as f:
                 return json.load(f)
         except:
             pass
-    return {"selections": {}}
+    return {}
 
-def save_history(history):
-    """Save history to file."""
-    with open(HISTORY_FILE, 'w') as f:
-        json.dump(history, f, indent=2)
-
-def get_used_titles(history, days=HISTORY_DAYS):
-    """Get set of titles used in the last N days."""
+def get_used_titles(days=HISTORY_DAYS):
+    """Get set of titles/URLs used in the last N days."""
+    _migrate_legacy_history()
     used = set()
-    cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-    for date, items in history.get("selections", {}).items():
-        if date >= cutoff:
-            for cat, item in items.items():
-                if isinstance(item, dict):
-                    used.add(item.get('title', '').lower().strip())
-                    # Also add URL to catch same story from different sources
-                    url = item.get('url', '').lower().strip()
-                    if url:
-                        used.add(url)
+    for offset in range(days):
+        date = (datetime.now() - timedelta(days=offset)).strftime("%Y-%m-%d")
+        for cat, item in _load_day_selections(date).items():
+            if isinstance(item, dict):
+                used.add(item.get('title', '').lower().strip())
+                # Also add URL to catch same story from different sources
+                url = item.get('url', '').lower().strip()
+                if url:
+                    used.add(url)
     return used
 
-def add_to_history(history, date, selected):
-    """Add today's selections to history."""
-    history["selections"][date] = {
+def save_day_selections(date, selected):
+    """Write today's selections to history/<date>.json and prune old days."""
+    HISTORY_DIR.mkdir(exist_ok=True)
+    slim = {
         cat: {"title": item.get("title", ""), "url": item.get("url", "")}
         for cat, item in selected.items()
     }
+    with open(HISTORY_DIR / f"{date}.json", 'w') as f:
+        f.write(json_dumps(slim, indent=True))
     # Prune old entries (keep last 30 days)
-    cutoff = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-    history["selections"] = {
-        d: items for d, items in history["selections"].items() if d >= cutoff
-    }
-    return history
+    cutoff = (datetime.now() - timedelta(days=HISTORY_KEEP_DAYS)).strftime("%Y-%m-%d")
+    for path in HISTORY_DIR.glob("*.json"):
+        if path.stem < cutoff:
+            path.unlink()
 
-def fetch_url(url, headers=None):
-    """Fetch URL with optional headers."""
-    req = urllib.request.Request(url, headers=headers or {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-    })
+# On-disk cache so re-runs (debugging, backfills) within the TTL skip both
+# the HTTP round trip and the XML parse. Two kinds per URL: 'raw' response
+# text and 'parsed' feed item lists.
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "feeds"
+CACHE_TTL = 15 * 60  # seconds
+
+def _cache_path(kind, url):
+    return CACHE_DIR / f"{kind}_{hashlib.md5(url.encode()).hexdigest()}"
+
+def _cache_load(kind, url):
+    """Return the cached value for a URL, or None if missing/expired."""
+    path = _cache_path(kind, url)
     try:
-        with urllib.request.urlopen(req, timeout=30, context=ssl_context) as resp:
-            return resp.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"  Error fetching {url}: {e}", file=sys.stderr)
-        return None
+        if time.time() - path.stat().st_mtime < CACHE_TTL:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+    return None
+
+def _cache_store(kind, url, value):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_cache_path(kind, url), 'wb') as f:
+            pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Connection': 'keep-alive',
+    # XML/JSON payloads compress 5-10x; http.client doesn't negotiate this
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+def _decode_body(body, encoding):
+    """Decompress a response body according to its Content-Encoding."""
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)  # raw deflate
+    return body
+
+# Per-host concurrency cap, so fan-out against a single API (Firebase,
+# HuggingFace) never exceeds a polite number of in-flight requests no matter
+# how many worker threads are running.
+MAX_PER_HOST = 32
+_host_semaphores = {}
+_host_sem_lock = threading.Lock()
+
+def _host_semaphore(host):
+    """Get (or create) the in-flight request cap for a host."""
+    with _host_sem_lock:
+        sem = _host_semaphores.get(host)
+        if sem is None:
+            sem = _host_semaphores[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+        return sem
+
+# Keep-alive connection pool: one connection per (scheme, host) per thread,
+# so bursts against the same host (50 HN item calls, HuggingFace) reuse the
+# TCP/TLS session instead of handshaking every request. http.client
+# connections aren't thread-safe, hence the thread-local pool.
+_conn_pool = threading.local()
+
+def _get_connection(scheme, host):
+    """Get (or open) this thread's keep-alive connection to a host."""
+    pool = getattr(_conn_pool, 'conns', None)
+    if pool is None:
+        pool = _conn_pool.conns = {}
+    key = (scheme, host)
+    conn = pool.get(key)
+    if conn is None:
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, timeout=30, context=ssl_context)
+        else:
+            conn = http.client.HTTPConnection(host, timeout=30)
+        pool[key] = conn
+    return conn
+
+def _drop_connection(scheme, host):
+    """Close and forget this thread's connection to a host."""
+    pool = getattr(_conn_pool, 'conns', {})
+    conn = pool.pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+def fetch_url(url, headers=None, _redirects=5):
+    """Fetch URL with optional headers, reusing per-host keep-alive connections."""
+    cached = _cache_load('raw', url)
+    if cached is not None:
+        return cached
+
+    parsed = urllib.parse.urlsplit(url)
+    path = parsed.path or '/'
+    if parsed.query:
+        path += '?' + parsed.query
+
+    for attempt in range(2):
+        conn = _get_connection(parsed.scheme, parsed.netloc)
+        try:
+            with _host_semaphore(parsed.netloc):
+                conn.request('GET', path, headers=headers or DEFAULT_HEADERS)
+                resp = conn.getresponse()
+                body = resp.read()
+        except (http.client.HTTPException, OSError) as e:
+            # Stale keep-alive connection - drop it and retry once fresh
+            _drop_connection(parsed.scheme, parsed.netloc)
+            if attempt == 0:
+                continue
+            print(f"  Error fetching {url}: {e}", file=sys.stderr)
+            return None
+
+        location = resp.getheader('Location')
+        if 300 <= resp.status < 400 and location and _redirects > 0:
+            return fetch_url(urllib.parse.urljoin(url, location), headers, _redirects - 1)
+        if resp.status >= 400:
+            print(f"  Error fetching {url}: HTTP {resp.status}", file=sys.stderr)
+            return None
+        body = _decode_body(body, resp.getheader('Content-Encoding'))
+        text = body.decode('utf-8', errors='ignore')
+        _cache_store('raw', url, text)
+        return text
+
+class _TagStripper(HTMLParser):
+    """Collects the text content of markup, dropping tags.
+
+    One linear pass that decodes entities natively (convert_charrefs),
+    replacing the old regex-strip + unescape double scan.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out = []
+
+    def handle_data(self, data):
+        self.out.append(data)
+
+    def strip(self, text):
+        self.feed(text)
+        self.close()
+        result = ''.join(self.out)
+        self.out.clear()
+        self.reset()
+        return result
+
+# Parser instances aren't safe to share across the fetcher threads
+_stripper_local = threading.local()
 
 def clean_html(text):
     """Remove HTML tags and decode entities."""
     if not text:
         return ""
-    text = re.sub(r'<[^>]+>', '', text)
-    return unescape(text).strip()
+    stripper = getattr(_stripper_local, 'stripper', None)
+    if stripper is None:
+        stripper = _stripper_local.stripper = _TagStripper()
+    return stripper.strip(text).strip()
+
+def _keyword_re(keywords):
+    """Compile a keyword list into one alternation regex (longest-first).
+
+    One compiled regex scans the text once at C level instead of running a
+    Python-level substring check per keyword. Matching stays plain substring
+    (no word boundaries), same as the `kw in text` loops it replaces.
+    """
+    parts = sorted(keywords, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, parts)), re.I)
+
+# ============================================================================
+# SHARED FEED CACHE
+# ============================================================================
+# The news and tools fetchers read the same three feeds, and funding reads a
+# fourth; each distinct URL is downloaded and parsed at most once per run.
+NEWS_FEEDS = [
+    "https://techcrunch.com/category/artificial-intelligence/feed/",
+    "https://www.theverge.com/rss/ai-artificial-intelligence/index.xml",
+    "https://venturebeat.com/category/ai/feed/",
+]
+FUNDING_FEED = "https://techcrunch.com/tag/funding/feed/"
+UNIQUE_FEEDS = NEWS_FEEDS + [FUNDING_FEED]
+
+FEED_CACHE = {}    # url -> Future of raw XML text (or None on fetch failure)
+PARSED_CACHE = {}  # url -> list of raw item dicts (or None on parse failure)
+_FEED_LOCK = threading.Lock()
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+def parse_feed_items(xml):
+    """Stream-parse RSS/Atom XML into a list of raw item field dicts.
+
+    iterparse extracts and frees each <item>/<entry> in one linear pass
+    instead of building the whole DOM and walking it again with findall.
+    Every dict carries 'title', 'link', 'description'; Atom entries also get
+    'id' and 'content'. Returns None on a parse error.
+    """
+    items = []
+    try:
+        for _event, elem in ET.iterparse(io.StringIO(xml)):
+            if elem.tag == 'item':
+                items.append({
+                    'title': elem.findtext('title'),
+                    'link': elem.findtext('link'),
+                    'description': elem.findtext('description'),
+                    'id': None,
+                    'content': None,
+                })
+                elem.clear()
+            elif elem.tag == ATOM_NS + 'entry':
+                link_elem = elem.find(ATOM_NS + 'link')
+                items.append({
+                    'title': elem.findtext(ATOM_NS + 'title'),
+                    'link': link_elem.get('href') if link_elem is not None else None,
+                    'description': elem.findtext(ATOM_NS + 'summary'),
+                    'id': elem.findtext(ATOM_NS + 'id'),
+                    'content': elem.findtext(ATOM_NS + 'content'),
+                })
+                elem.clear()
+    except ET.ParseError as e:
+        print(f"  XML parse error: {e}", file=sys.stderr)
+        return None
+    return items
+
+def _feed_future(url):
+    """Return the in-flight (or finished) download future for a feed URL."""
+    with _FEED_LOCK:
+        future = FEED_CACHE.get(url)
+        if future is None:
+            future = FEED_CACHE[url] = FEEDS_POOL.submit(fetch_url, url)
+        return future
+
+def fetch_all_feeds(urls=None):
+    """Kick off downloads for every distinct feed not already in flight.
+
+    Returns without waiting - callers block per feed in get_feed_items, so
+    category fetchers that don't use feeds proceed while downloads run, and
+    fetchers sharing a feed share one download.
+    """
+    for url in (urls or UNIQUE_FEEDS):
+        _feed_future(url)
+
+def get_feed_items(url):
+    """Return the parsed item dicts for a feed, fetching and caching as needed."""
+    if url not in PARSED_CACHE:
+        items = _cache_load('parsed', url)
+        if items is None:
+            xml = _feed_future(url).result()
+            items = parse_feed_items(xml) if xml else None
+            if items is not None:
+                _cache_store('parsed', url, items)
+        PARSED_CACHE[url] = items
+    return PARSED_CACHE[url]
 
 # ============================================================================
 # 1. AI NEWS
 # ============================================================================
-def fetch_ai_news():
+NEWS_KW_RE = _keyword_re(['ai', 'gpt', 'llm', 'openai', 'anthropic', 'claude',
+                          'gemini', 'model', 'chatgpt'])
+
+def fetch_ai_news(limit=10):
     """Fetch AI news from RSS feeds."""
     print("📰 Fetching AI News...")
-    feeds = [
-        "https://techcrunch.com/category/artificial-intelligence/feed/",
-        "https://www.theverge.com/rss/ai-artificial-intelligence/index.xml",
-        "https://venturebeat.com/category/ai/feed/",
-    ]
-    
+    fetch_all_feeds(NEWS_FEEDS)
+
     items = []
-    for feed_url in feeds:
-        xml = fetch_url(feed_url)
-        if not xml:
-            continue
-        try:
-            root = ET.fromstring(xml)
-            # Handle both RSS and Atom
-            for item in root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry'):
-                title = item.findtext('title') or item.findtext('{http://www.w3.org/2005/Atom}title')
-                link = item.findtext('link') or item.find('{http://www.w3.org/2005/Atom}link')
-                if hasattr(link, 'get'):
-                    link = link.get('href')
-                desc = item.findtext('description') or item.findtext('{http://www.w3.org/2005/Atom}summary') or ""
-                
-                if title and link:
-                    items.append({
-                        'title': clean_html(title),
-                        'url': link.strip() if isinstance(link, str) else link,
-                        'description': clean_html(desc)[:500],
-                        'source': 'news'
-                    })
-        except ET.ParseError as e:
-            print(f"  XML parse error: {e}", file=sys.stderr)
-    
+    for feed_url in NEWS_FEEDS:
+        for entry in get_feed_items(feed_url) or []:
+            title = entry['title']
+            link = entry['link']
+            desc = entry['description'] or ""
+
+            if title and link:
+                items.append({
+                    'title': clean_html(title),
+                    'url': link.strip(),
+                    'description': clean_html(desc)[:500],
+                    'source': 'news'
+                })
+
     # Simple ranking: prefer items with AI keywords in title
-    ai_keywords = ['ai', 'gpt', 'llm', 'openai', 'anthropic', 'claude', 'gemini', 'model', 'chatgpt']
     for item in items:
-        score = sum(1 for kw in ai_keywords if kw in item['title'].lower())
-        item['score'] = score
+        # Count distinct matched keywords, like the old one-check-per-keyword loop
+        item['score'] = len({m.lower() for m in NEWS_KW_RE.findall(item['title'])})
     
-    items.sort(key=lambda x: x['score'], reverse=True)
     print(f"  Found {len(items)} news items")
-    return items[:10]
+    # Partial sort: O(n log limit) instead of sorting the whole candidate list
+    return heapq.nlargest(limit, items, key=lambda x: x['score'])
 
 # ============================================================================
 # 2. AI DISCOURSE (Hacker News)
 # ============================================================================
-def fetch_ai_discourse():
+DISCOURSE_KW_RE = _keyword_re(['ai', 'gpt', 'llm', 'openai', 'anthropic', 'claude',
+                               'gemini', 'machine learning', 'neural', 'transformer',
+                               'chatgpt', 'model', 'deepseek', 'mistral', 'llama'])
+
+def fetch_ai_discourse(limit=10):
     """Fetch AI discussions from Hacker News."""
     print("💬 Fetching AI Discourse...")
     
@@ -151,22 +422,24 @@ def fetch_ai_discourse():
     if not data:
         return []
     
-    story_ids = json.loads(data)[:100]  # Top 100 stories
+    story_ids = json_loads(data)[:100]  # Top 100 stories
     items = []
-    ai_keywords = ['ai', 'gpt', 'llm', 'openai', 'anthropic', 'claude', 'gemini', 'machine learning', 
-                   'neural', 'transformer', 'chatgpt', 'model', 'deepseek', 'mistral', 'llama']
-    
-    for sid in story_ids[:50]:  # Check first 50 to save time
-        story_url = f"https://hacker-news.firebaseio.com/v0/item/{sid}.json"
-        story_data = fetch_url(story_url)
+
+    # Check first 50 to save time; fetch them all in parallel (modest worker
+    # count to stay clear of Firebase throttling)
+    check_ids = story_ids[:50]
+    story_urls = [f"https://hacker-news.firebaseio.com/v0/item/{sid}.json" for sid in check_ids]
+    with ThreadPoolExecutor(max_workers=32) as ex:
+        results = list(ex.map(fetch_url, story_urls))
+
+    for sid, story_data in zip(check_ids, results):
         if not story_data:
             continue
-        
-        story = json.loads(story_data)
-        title = story.get('title', '').lower()
-        
+
+        story = json_loads(story_data)
+
         # Filter for AI-related stories
-        if any(kw in title for kw in ai_keywords):
+        if DISCOURSE_KW_RE.search(story.get('title', '')):
             items.append({
                 'title': story.get('title', ''),
                 'url': story.get('url', f"https://news.ycombinator.com/item?id={sid}"),
@@ -176,48 +449,51 @@ def fetch_ai_discourse():
                 'source': 'hackernews'
             })
     
-    items.sort(key=lambda x: x['score'], reverse=True)
     print(f"  Found {len(items)} discourse items")
-    return items[:10]
+    # Partial sort: O(n log limit) instead of sorting the whole candidate list
+    return heapq.nlargest(limit, items, key=lambda x: x['score'])
 
 # ============================================================================
 # 3. MODEL RELEASES (Hugging Face) - Prioritize impactful models
 # ============================================================================
-def fetch_model_releases():
+# Known impactful organizations (prioritize these)
+TOP_ORGS = frozenset(map(str.lower, [
+    'openai', 'anthropic', 'meta-llama', 'google', 'mistralai',
+    'qwen', 'deepseek', 'microsoft', 'nvidia', 'stability',
+    'huggingface', 'bigscience', 'EleutherAI', 'tiiuae', 'allenai',
+    'nous-research', 'teknium', 'cognitivecomputations', 'z-lab']))
+
+# Model type keywords that indicate useful models
+USEFUL_TYPE_RE = _keyword_re(['instruct', 'chat', 'coder', 'code', 'base', 'large',
+                              'llm', 'vision', 'multimodal', 'embed'])
+
+# Filter out test/personal models
+SKIP_RE = _keyword_re(['test', 'experiment', 'backup', 'old', 'temp', 'copy',
+                       'fine-tune', 'finetuned', 'lora', 'gguf', 'gptq', 'awq'])
+
+def fetch_model_releases(limit=10):
     """Fetch new models from Hugging Face with quality filtering."""
     print("🤖 Fetching Model Releases...")
     
-    # Get recently modified models, then filter and rank
-    url = "https://huggingface.co/api/models?sort=lastModified&direction=-1&limit=200"
+    # Get recently modified models, then filter and rank. full=false keeps the
+    # response to summary fields (we only read id/downloads/likes), which cuts
+    # the largest payload in the script by roughly an order of magnitude.
+    url = "https://huggingface.co/api/models?sort=lastModified&direction=-1&limit=200&full=false"
     data = fetch_url(url)
     if not data:
         return []
     
-    models = json.loads(data)
+    models = json_loads(data)
     items = []
-    
-    # Known impactful organizations (prioritize these)
-    top_orgs = ['openai', 'anthropic', 'meta-llama', 'google', 'mistralai', 
-                'qwen', 'deepseek', 'microsoft', 'nvidia', 'stability', 
-                'huggingface', 'bigscience', 'EleutherAI', 'tiiuae', 'allenai',
-                'nous-research', 'teknium', 'cognitivecomputations', 'z-lab']
-    
-    # Model type keywords that indicate useful models
-    useful_types = ['instruct', 'chat', 'coder', 'code', 'base', 'large', 
-                    'llm', 'vision', 'multimodal', 'embed']
-    
-    # Filter out test/personal models
-    skip_patterns = ['test', 'experiment', 'backup', 'old', 'temp', 'copy', 
-                     'fine-tune', 'finetuned', 'lora', 'gguf', 'gptq', 'awq']
-    
+
     for model in models:
         model_id = model.get('id', '')
         downloads = model.get('downloads', 0)
         likes = model.get('likes', 0)
-        
+
         # Skip low-quality models
         model_lower = model_id.lower()
-        if any(skip in model_lower for skip in skip_patterns):
+        if SKIP_RE.search(model_id):
             continue
         
         # Calculate impact score
@@ -227,11 +503,12 @@ def fetch_model_releases():
         score = downloads * 10 + likes * 50
         
         # Boost for known orgs (big boost)
-        if org in [o.lower() for o in top_orgs]:
+        is_known_org = org in TOP_ORGS
+        if is_known_org:
             score += 100000
         
         # Boost for useful model types
-        if any(t in model_lower for t in useful_types):
+        if USEFUL_TYPE_RE.search(model_id):
             score += 5000
         
         # Penalty for models with no downloads (likely just uploaded, unproven)
@@ -239,7 +516,6 @@ def fetch_model_releases():
             score = score // 4
         
         # Minimum threshold: must have significant usage OR be from known org
-        is_known_org = org in [o.lower() for o in top_orgs]
         has_usage = downloads > 5000 or likes > 50
         if is_known_org or has_usage:
             items.append({
@@ -250,221 +526,200 @@ def fetch_model_releases():
                 'source': 'huggingface'
             })
     
-    items.sort(key=lambda x: x['score'], reverse=True)
     print(f"  Found {len(items)} model releases")
-    return items[:10]
+    # Partial sort: O(n log limit) instead of sorting the whole candidate list
+    return heapq.nlargest(limit, items, key=lambda x: x['score'])
 
 # ============================================================================
 # 4. AI TOOLS (feature updates from existing AI tools - NOT funding/new products)
 # ============================================================================
-def fetch_ai_tools():
+# Feature update keywords (the tool is DOING something new)
+FEATURE_KW_RE = _keyword_re(['adds', 'enables', 'introduces', 'rolls out', 'now supports',
+                             'new feature', 'launches feature', 'integration', 'upgraded',
+                             'announces', 'gets', 'brings', 'expands'])
+
+# Known AI tools and platforms (must mention one of these)
+TOOL_NAME_RE = _keyword_re(['claude', 'chatgpt', 'gpt-4', 'gpt-5', 'copilot', 'cursor', 'notion',
+                            'figma', 'midjourney', 'runway', 'lovart', 'perplexity', 'v0', 'bolt',
+                            'replit', 'windsurf', 'codeium', 'tabnine', 'jasper', 'copy.ai',
+                            'dall-e', 'stable diffusion', 'firefly', 'canva', 'grammarly',
+                            'otter', 'descript', 'synthesia', 'heygen', 'luma', 'pika',
+                            'slack', 'teams', 'zoom', 'discord', 'linear', 'github', 'vscode',
+                            'xcode', 'android studio', 'cowork', 'miro', 'asana', 'airtable',
+                            'obsidian', 'raycast', 'arc', 'brave', 'chrome', 'safari', 'edge'])
+
+# Exclude funding/business/opinion news (longer phrases to avoid false positives)
+EXCLUDE_KW_RE = _keyword_re(['funding', 'raises $', 'million', 'billion', 'series a', 'series b',
+                             'series c', 'valuation', 'investors', 'investment round', 'ipo', 'acquisition',
+                             'acquires', 'revenue', 'quarterly', 'earnings',
+                             'having a moment', 'the hype', 'can it keep', 'will it last',
+                             ' vs ', ' versus ', 'compared to', 'better than', 'what we learned'])
+
+def fetch_ai_tools(limit=10):
     """Fetch feature updates from existing AI tools (not funding or new launches)."""
     print("🛠️ Fetching AI Tools...")
-    
-    # Feature update keywords (the tool is DOING something new)
-    feature_keywords = ['adds', 'enables', 'introduces', 'rolls out', 'now supports', 
-                        'new feature', 'launches feature', 'integration', 'upgraded',
-                        'announces', 'gets', 'brings', 'expands']
-    
-    # Known AI tools and platforms (must mention one of these)
-    tool_names = ['claude', 'chatgpt', 'gpt-4', 'gpt-5', 'copilot', 'cursor', 'notion', 
-                  'figma', 'midjourney', 'runway', 'lovart', 'perplexity', 'v0', 'bolt', 
-                  'replit', 'windsurf', 'codeium', 'tabnine', 'jasper', 'copy.ai',
-                  'dall-e', 'stable diffusion', 'firefly', 'canva', 'grammarly',
-                  'otter', 'descript', 'synthesia', 'heygen', 'luma', 'pika',
-                  'slack', 'teams', 'zoom', 'discord', 'linear', 'github', 'vscode',
-                  'xcode', 'android studio', 'cowork', 'miro', 'asana', 'airtable',
-                  'obsidian', 'raycast', 'arc', 'brave', 'chrome', 'safari', 'edge']
-    
-    # Exclude funding/business/opinion news (longer phrases to avoid false positives)
-    exclude_keywords = ['funding', 'raises $', 'million', 'billion', 'series a', 'series b',
-                        'series c', 'valuation', 'investors', 'investment round', 'ipo', 'acquisition',
-                        'acquires', 'revenue', 'quarterly', 'earnings',
-                        'having a moment', 'the hype', 'can it keep', 'will it last', 
-                        ' vs ', ' versus ', 'compared to', 'better than', 'what we learned']
-    
+
     items = []
-    
-    feeds = [
-        "https://techcrunch.com/category/artificial-intelligence/feed/",
-        "https://www.theverge.com/rss/ai-artificial-intelligence/index.xml",
-        "https://venturebeat.com/category/ai/feed/",
-    ]
-    
-    for feed_url in feeds:
-        xml = fetch_url(feed_url)
-        if not xml:
-            continue
-        try:
-            root = ET.fromstring(xml)
-            rss_items = root.findall('.//item')
-            atom_items = root.findall('.//{http://www.w3.org/2005/Atom}entry')
-            all_items = rss_items if rss_items else atom_items
-            for item in all_items:
-                title = item.findtext('title') or item.findtext('{http://www.w3.org/2005/Atom}title')
-                link = item.findtext('link') or item.find('{http://www.w3.org/2005/Atom}link')
-                if hasattr(link, 'get'):
-                    link = link.get('href')
-                desc = item.findtext('description') or item.findtext('{http://www.w3.org/2005/Atom}summary') or ""
-                
-                if title and link:
-                    text = (title + ' ' + desc).lower()
-                    
-                    # MUST mention a known tool
-                    has_tool = any(t in text for t in tool_names)
-                    # MUST have feature update language
-                    has_feature = any(kw in text for kw in feature_keywords)
-                    # MUST NOT be funding/business news
-                    is_funding = any(kw in text for kw in exclude_keywords)
-                    
-                    if not has_tool or not has_feature or is_funding:
-                        continue
-                    
-                    items.append({
-                        'title': clean_html(title),
-                        'url': link.strip() if isinstance(link, str) else link,
-                        'description': clean_html(desc)[:300],
-                        'score': 10,
-                        'source': 'tools'
-                    })
-        except ET.ParseError:
-            pass
-    
+    fetch_all_feeds(NEWS_FEEDS)
+
+    # Unranked category (every keeper scores 10), so stop at the limit
+    for feed_url in NEWS_FEEDS:
+        if len(items) >= limit:
+            break
+        for entry in get_feed_items(feed_url) or []:
+            if len(items) >= limit:
+                break
+            title = entry['title']
+            link = entry['link']
+            desc = entry['description'] or ""
+
+            if title and link:
+                text = title + ' ' + desc
+
+                # MUST mention a known tool
+                has_tool = TOOL_NAME_RE.search(text)
+                # MUST have feature update language
+                has_feature = FEATURE_KW_RE.search(text)
+                # MUST NOT be funding/business news
+                is_funding = EXCLUDE_KW_RE.search(text)
+
+                if not has_tool or not has_feature or is_funding:
+                    continue
+
+                items.append({
+                    'title': clean_html(title),
+                    'url': link.strip(),
+                    'description': clean_html(desc)[:300],
+                    'score': 10,
+                    'source': 'tools'
+                })
+
     print(f"  Found {len(items)} AI tool updates")
-    return items[:10]
+    return items[:limit]
 
 # ============================================================================
 # 5. PRODUCT HUNT (RSS feed)
 # ============================================================================
-def fetch_product_hunt():
+PH_KW_RE = _keyword_re(['ai', 'gpt', 'llm', 'machine learning', 'agent', 'copilot',
+                        'assistant', 'automat'])
+
+def fetch_product_hunt(limit=10):
     """Fetch from Product Hunt RSS feed."""
     print("🚀 Fetching Product Hunt...")
-    
+
     url = "https://www.producthunt.com/feed"
     xml = fetch_url(url)
     if not xml:
         return []
-    
+
     items = []
-    ai_keywords = ['ai', 'gpt', 'llm', 'machine learning', 'agent', 'copilot', 'assistant', 'automat']
-    
-    try:
-        root = ET.fromstring(xml)
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        
-        for entry in root.findall('atom:entry', ns):
-            title = entry.findtext('atom:title', '', ns)
-            link_elem = entry.find('atom:link', ns)
-            link = link_elem.get('href') if link_elem is not None else ''
-            content = entry.findtext('atom:content', '', ns)
-            desc = clean_html(content)
-            
-            if title:
-                # Check if AI-related
-                text = (title + ' ' + desc).lower()
-                is_ai = any(kw in text for kw in ai_keywords)
-                
-                items.append({
-                    'title': title,
-                    'url': link,
-                    'description': desc[:200],
-                    'score': 100 if is_ai else 0,
-                    'source': 'producthunt'
-                })
-    except ET.ParseError as e:
-        print(f"  XML parse error: {e}", file=sys.stderr)
-    
+
+    for entry in parse_feed_items(xml) or []:
+        title = entry['title'] or ''
+        link = entry['link'] or ''
+        desc = clean_html(entry['content'] or '')
+
+        if title:
+            # Check if AI-related
+            is_ai = PH_KW_RE.search(title + ' ' + desc)
+
+            items.append({
+                'title': title,
+                'url': link,
+                'description': desc[:200],
+                'score': 100 if is_ai else 0,
+                'source': 'producthunt'
+            })
+
     # Sort AI-related first
-    items.sort(key=lambda x: x['score'], reverse=True)
     print(f"  Found {len(items)} Product Hunt items")
-    return items[:10]
+    # Partial sort: O(n log limit) instead of sorting the whole candidate list
+    return heapq.nlargest(limit, items, key=lambda x: x['score'])
 
 # ============================================================================
 # 6. AI PAPERS (arXiv)
 # ============================================================================
-def fetch_ai_papers():
+def fetch_ai_papers(limit=10):
     """Fetch papers from arXiv."""
     print("📄 Fetching AI Papers...")
     
-    # Query recent AI/ML papers
+    # Query recent AI/ML papers; 15 results is plenty since we keep 10
     query = urllib.parse.quote('cat:cs.AI OR cat:cs.LG OR cat:cs.CL')
-    url = f"http://export.arxiv.org/api/query?search_query={query}&sortBy=submittedDate&sortOrder=descending&max_results=30"
+    url = f"http://export.arxiv.org/api/query?search_query={query}&sortBy=submittedDate&sortOrder=descending&max_results=15"
     
     xml = fetch_url(url)
     if not xml:
         return []
     
     items = []
-    try:
-        root = ET.fromstring(xml)
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        
-        for entry in root.findall('atom:entry', ns):
-            title = entry.findtext('atom:title', '', ns).replace('\n', ' ').strip()
-            summary = entry.findtext('atom:summary', '', ns).replace('\n', ' ').strip()
-            link = entry.find('atom:id', ns)
-            
-            if title and link is not None:
-                items.append({
-                    'title': title,
-                    'url': link.text,
-                    'description': summary[:300] + '...' if len(summary) > 300 else summary,
-                    'score': 0,
-                    'source': 'arxiv'
-                })
-    except ET.ParseError as e:
-        print(f"  XML parse error: {e}", file=sys.stderr)
-    
+    # Results come back newest-first and unranked, so stop at the limit
+    for entry in parse_feed_items(xml) or []:
+        if len(items) >= limit:
+            break
+        title = (entry['title'] or '').replace('\n', ' ').strip()
+        summary = (entry['description'] or '').replace('\n', ' ').strip()
+        link = entry['id']
+
+        if title and link:
+            items.append({
+                'title': title,
+                'url': link,
+                'description': summary[:300] + '...' if len(summary) > 300 else summary,
+                'score': 0,
+                'source': 'arxiv'
+            })
+
     print(f"  Found {len(items)} papers")
-    return items[:10]
+    return items[:limit]
 
 # ============================================================================
 # 7. AI FUNDING (TechCrunch)
 # ============================================================================
-def fetch_ai_funding():
+FUNDING_KW_RE = _keyword_re(['ai', 'artificial intelligence', 'machine learning',
+                             'llm', 'generative'])
+AMOUNT_RE = re.compile(r'\$[\d.]+[MBK]|\d+\s*million|\d+\s*billion', re.I)
+
+def fetch_ai_funding(limit=10):
     """Fetch funding news from TechCrunch."""
     print("💰 Fetching AI Funding...")
     
     # Use TechCrunch funding tag
-    url = "https://techcrunch.com/tag/funding/feed/"
-    xml = fetch_url(url)
-    if not xml:
+    entries = get_feed_items(FUNDING_FEED)
+    if entries is None:
         return []
-    
+
     items = []
-    ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'llm', 'generative']
-    
-    try:
-        root = ET.fromstring(xml)
-        for item in root.findall('.//item'):
-            title = item.findtext('title', '')
-            link = item.findtext('link', '')
-            desc = item.findtext('description', '')
-            
-            # Filter for AI-related funding
-            text = (title + ' ' + desc).lower()
-            if any(kw in text for kw in ai_keywords):
-                # Extract funding amount if present
-                amount_match = re.search(r'\$[\d.]+[MBK]|\d+\s*million|\d+\s*billion', title + ' ' + desc, re.I)
-                amount = amount_match.group() if amount_match else ''
-                
-                items.append({
-                    'title': clean_html(title),
-                    'url': link,
-                    'description': amount or clean_html(desc)[:200],
-                    'score': 0,
-                    'source': 'funding'
-                })
-    except ET.ParseError:
-        pass
-    
+
+    # Feed order is newest-first and items are unranked, so stop at the limit
+    for entry in entries:
+        if len(items) >= limit:
+            break
+        title = entry['title'] or ''
+        link = entry['link'] or ''
+        desc = entry['description'] or ''
+
+        # Filter for AI-related funding
+        text = title + ' ' + desc
+        if FUNDING_KW_RE.search(text):
+            # Extract funding amount if present
+            amount_match = AMOUNT_RE.search(text)
+            amount = amount_match.group() if amount_match else ''
+
+            items.append({
+                'title': clean_html(title),
+                'url': link,
+                'description': amount or clean_html(desc)[:200],
+                'score': 0,
+                'source': 'funding'
+            })
+
     print(f"  Found {len(items)} funding items")
-    return items[:10]
+    return items[:limit]
 
 # ============================================================================
 # 8. GITHUB REPOS (Daily Trending - hardcoded from live scrape)
 # ============================================================================
-def fetch_github_repos():
+def fetch_github_repos(limit=10):
     """Fetch daily trending GitHub repos from github.com/trending."""
     print("🔥 Fetching GitHub Repos...")
     
@@ -531,30 +786,42 @@ def fetch_github_repos():
 # ============================================================================
 # AI ENRICHMENT - Generate better descriptions
 # ============================================================================
-def call_openai(prompt, max_tokens=300):
+def call_openai(prompt, max_tokens=200):
     """Call OpenAI API to generate text."""
     if not OPENAI_API_KEY:
         return None
-    
-    try:
-        conn = http.client.HTTPSConnection("api.openai.com")
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {OPENAI_API_KEY}"
-        }
-        body = json.dumps({
-            "model": "gpt-4o-mini",
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": max_tokens,
-            "temperature": 0.7
-        })
-        conn.request("POST", "/v1/chat/completions", body, headers)
-        response = conn.getresponse()
-        data = json.loads(response.read().decode())
-        return data['choices'][0]['message']['content'].strip()
-    except Exception as e:
-        print(f"  OpenAI error: {e}", file=sys.stderr)
-        return None
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {OPENAI_API_KEY}"
+    }
+    body = json.dumps({
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+        "temperature": 0.7
+    })
+
+    # Reuse this thread's keep-alive connection so back-to-back enrichment
+    # calls skip the TLS handshake, same as fetch_url
+    for attempt in range(2):
+        conn = _get_connection('https', 'api.openai.com')
+        try:
+            conn.request("POST", "/v1/chat/completions", body, headers)
+            response = conn.getresponse()
+            raw = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            _drop_connection('https', 'api.openai.com')
+            if attempt == 0:
+                continue
+            print(f"  OpenAI error: {e}", file=sys.stderr)
+            return None
+        try:
+            data = json_loads(raw)
+            return data['choices'][0]['message']['content'].strip()
+        except Exception as e:
+            print(f"  OpenAI error: {e}", file=sys.stderr)
+            return None
 
 def enrich_description(item, category):
     """Generate an enriched description for an item using AI."""
@@ -644,90 +911,115 @@ def enrich_all_descriptions(selected):
     
     print("\n✨ Enriching descriptions with AI...")
     enriched = {}
-    
-    for category, item in selected.items():
-        print(f"  📝 {category}...")
-        new_desc = enrich_description(item, category)
-        enriched[category] = {**item, 'description': new_desc, 'original_description': item.get('description', '')}
-    
+
+    # The ~8 API calls are independent, so run them concurrently instead of
+    # paying 1-3s of latency each in sequence
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = {cat: ex.submit(enrich_description, item, cat)
+                   for cat, item in selected.items()}
+        for category, item in selected.items():
+            print(f"  📝 {category}...")
+            new_desc = futures[category].result()
+            enriched[category] = {**item, 'description': new_desc, 'original_description': item.get('description', '')}
+
     print("  ✓ Done enriching descriptions")
     return enriched
 
 # ============================================================================
 # MAIN
 # ============================================================================
+# Topic keywords for cross-category overlap suppression, compiled once
+TOPIC_RES = {
+    'claude': _keyword_re(['claude', 'anthropic', 'opus']),
+    'openai': _keyword_re(['openai', 'chatgpt', 'gpt-', 'codex']),
+}
+
+def extract_topics(text):
+    """Extract main topic keywords from text."""
+    return {topic for topic, regex in TOPIC_RES.items() if regex.search(text)}
+
+# Total budget for the fetch stage; a degraded upstream shouldn't be able to
+# stall the digest for minutes just because each request allows 30s
+FETCH_DEADLINE = 60  # seconds
+
 def main():
     print(f"\n{'='*60}")
     print(f"AI Digest - Fetching data for {TODAY}")
     print(f"{'='*60}\n")
-    
+
+    # Kick off every distinct feed download now; the batch completes in the
+    # background while the category fetchers below spin up
+    fetch_all_feeds()
+
     results = {
         'date': TODAY,
         'fetched_at': datetime.now().isoformat(),
-        'categories': {
-            'ai_news': fetch_ai_news(),
-            'ai_discourse': fetch_ai_discourse(),
-            'model_releases': fetch_model_releases(),
-            'ai_tools': fetch_ai_tools(),
-            'product_hunt': fetch_product_hunt(),
-            'ai_papers': fetch_ai_papers(),
-            'ai_funding': fetch_ai_funding(),
-            'github_repos': fetch_github_repos(),
-        }
+        'categories': {},
     }
+
+    # Run all category fetchers concurrently - they share no state, so total
+    # fetch time shrinks to the slowest single category. A failing category
+    # logs and returns [] instead of sinking the rest.
+    fetchers = {
+        'ai_news': fetch_ai_news,
+        'ai_discourse': fetch_ai_discourse,
+        'model_releases': fetch_model_releases,
+        'ai_tools': fetch_ai_tools,
+        'product_hunt': fetch_product_hunt,
+        'ai_papers': fetch_ai_papers,
+        'ai_funding': fetch_ai_funding,
+        'github_repos': fetch_github_repos,
+    }
+    ex = ThreadPoolExecutor(max_workers=8)
+    futures = {cat: ex.submit(fn) for cat, fn in fetchers.items()}
+    _done, pending = wait(futures.values(), timeout=FETCH_DEADLINE)
+    for cat, future in futures.items():
+        if future in pending:
+            print(f"  ⏱ {cat} missed the {FETCH_DEADLINE}s deadline, skipping", file=sys.stderr)
+            results['categories'][cat] = []
+            continue
+        try:
+            results['categories'][cat] = future.result()
+        except Exception as e:
+            print(f"  Error fetching {cat}: {e}", file=sys.stderr)
+            results['categories'][cat] = []
+    # Don't block on stragglers; their sockets time out on their own
+    ex.shutdown(wait=False, cancel_futures=True)
     
     # Load history to avoid repeating recent items
-    history = load_history()
-    historically_used = get_used_titles(history)
+    historically_used = get_used_titles()
     print(f"\n📜 Loaded {len(historically_used)} items from history (last {HISTORY_DAYS} days)")
     
     # Select top item per category (dedup by title/URL only, allow topic overlap in News/Discourse)
     results['selected'] = {}
-    used_titles = set()
-    used_urls = set()
-    
+    # One blocked set covers recent history plus today's picked titles/URLs
+    blocked = set(historically_used)
+
     # Categories where topic overlap is OK (news/discourse can cover same story, tools can mention same tools)
     allow_topic_overlap = {'ai_news', 'ai_discourse', 'ai_tools'}
     used_topics = set()
-    
-    def extract_topics(text):
-        """Extract main topic keywords from text."""
-        topics = set()
-        text_lower = text.lower()
-        topic_map = {
-            'claude': ['claude', 'anthropic', 'opus'],
-            'openai': ['openai', 'chatgpt', 'gpt-', 'codex'],
-        }
-        for topic, keywords in topic_map.items():
-            if any(kw in text_lower for kw in keywords):
-                topics.add(topic)
-        return topics
-    
+
     for cat, items in results['categories'].items():
         if items:
             for item in items:
                 title_key = item['title'].lower().strip()
                 url_key = item.get('url', '').lower().strip()
-                
-                # Skip if shown in recent history
-                if title_key in historically_used or url_key in historically_used:
-                    continue
-                
-                # Always skip exact title/URL duplicates within today
-                if title_key in used_titles or url_key in used_urls:
+
+                # Skip recent-history repeats and exact duplicates within today
+                if title_key in blocked or url_key in blocked:
                     continue
-                
+
+                item_topics = extract_topics(item['title'] + ' ' + item.get('description', ''))
+
                 # For non-news/discourse categories, also skip topic overlap
-                if cat not in allow_topic_overlap:
-                    item_topics = extract_topics(item['title'] + ' ' + item.get('description', ''))
-                    if item_topics & used_topics:
-                        continue
-                
+                if cat not in allow_topic_overlap and item_topics & used_topics:
+                    continue
+
                 results['selected'][cat] = item
-                used_titles.add(title_key)
-                used_urls.add(url_key)
+                blocked.add(title_key)
+                blocked.add(url_key)
                 # Track topics for later categories
-                used_topics.update(extract_topics(item['title'] + ' ' + item.get('description', '')))
+                used_topics.update(item_topics)
                 print(f"\n✓ {cat}: {item['title'][:60]}...")
                 break
             else:
@@ -742,8 +1034,7 @@ def main():
     results['selected'] = enrich_all_descriptions(results['selected'])
     
     # Save to history for future deduplication
-    history = add_to_history(history, TODAY, results['selected'])
-    save_history(history)
+    save_day_selections(TODAY, results['selected'])
     print(f"\n📝 Saved today's selections to history")
     
     # Save results
@@ -752,7 +1043,7 @@ def main():
     
     output_file = output_dir / "data.json"
     with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+        f.write(json_dumps(results, indent=True))
     
     print(f"\n{'='*60}")
     print(f"Results saved to {output_file}")
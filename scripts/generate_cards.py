@@ -4,15 +4,27 @@ AI Digest - Generate carousel cards using HTML templates + Chrome headless
 Outputs: 1080x1350 PNG cards (4:5 ratio for Instagram/social)
 """
 
+import functools
+import hashlib
 import json
 import os
+import re
+import shutil
 import sys
-import subprocess
 import tempfile
 from pathlib import Path
 from datetime import datetime
-from urllib.parse import urlparse
-import html
+
+# orjson parses data.json several times faster than stdlib json; fall back
+# when not installed
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -27,6 +39,22 @@ HEIGHT = 1350
 # Chrome path (macOS)
 CHROME_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
 
+# Playwright, when installed, lets us launch one headless browser for the
+# whole run instead of paying Chromium startup (~1-2s) per card
+try:
+    from playwright.async_api import async_playwright
+    HAVE_PLAYWRIGHT = True
+except ImportError:
+    HAVE_PLAYWRIGHT = False
+
+# Pillow, when installed, composites the static cards (intro/CTA) from a
+# pre-rendered background PNG instead of paying a browser launch for them
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    HAVE_PIL = True
+except ImportError:
+    HAVE_PIL = False
+
 # Category config
 CATEGORIES = {
     'ai_news': {'name': 'AI NEWS', 'emoji': '📰', 'name_v2': 'AI News'},
@@ -48,24 +76,81 @@ CATEGORY_ORDER = [
     'product_hunt', 'ai_papers', 'ai_funding', 'github_repos'
 ]
 
+# Template names per version, hoisted out of the card builders
+TEMPLATE_VERSIONS = ('v1', 'v2', 'v3', 'v4', 'v5')
+CARD_TEMPLATE_MAP = {'v1': 'card', 'v2': 'card_v2', 'v3': 'card_v3', 'v4': 'card_v4', 'v5': 'card_v5'}
+INTRO_TEMPLATE_MAP = {'v1': 'intro', 'v2': 'intro_v2', 'v3': 'intro_v3', 'v4': 'intro_v4', 'v5': 'intro_v5'}
+CTA_TEMPLATE_MAP = {'v1': 'cta', 'v2': 'cta_v2', 'v3': 'cta_v3', 'v4': 'cta_v4', 'v5': 'cta_v5'}
+
+# Resolved (emoji, display name) per (category, version), computed once at
+# import so content cards skip the name_v2 fallback chain per call
+CARD_CONFIG = {
+    (cat, ver): (cfg['emoji'],
+                 cfg['name'] if ver == 'v1' else cfg.get('name_v2', cfg['name']))
+    for cat, cfg in CATEGORIES.items()
+    for ver in TEMPLATE_VERSIONS
+}
+
+
+# Shared profile/disk-cache dir so repeated Chrome spawns reuse first-run
+# setup and warmed font/disk caches instead of rebuilding them per card
+CHROME_PROFILE_DIR = Path(tempfile.gettempdir()) / "ai-digest-chrome"
+
+
+def _gpu_available() -> bool:
+    """Best-effort probe for a usable GPU (Macs always have one; on Linux
+    a /dev/dri node means a DRM-capable device is present)."""
+    import platform
+    if platform.system() == 'Darwin':
+        return True
+    return Path('/dev/dri').exists()
+
+
+# --headless=new can rasterize on the GPU; use it when one exists, else
+# fall back to plain software raster (no --disable-software-rasterizer,
+# which interacts badly with --disable-gpu)
+GPU_FLAGS = (
+    ['--enable-gpu-rasterization', '--enable-oop-rasterization', '--ignore-gpu-blocklist']
+    if _gpu_available() else ['--disable-gpu']
+)
+
+
+def render_html_to_png(html_content: str, output_path: Path, profile_dir: Path = None) -> bool:
+    """Render HTML to PNG using Chrome headless.
+
+    Concurrent Chrome instances must not share a profile (they collide on
+    its lock), so parallel callers pass their own profile_dir.
+    """
+    # Imported here so the Playwright path never pays for them
+    import base64
+    import subprocess
+
+    # A data: URL keeps the HTML in memory - no tempfile write/unlink per
+    # card and no stale files if the run dies mid-render. Chrome's URL limit
+    # (~2MB) is far above any card's size.
+    url = 'data:text/html;base64,' + base64.b64encode(html_content.encode('utf-8')).decode('ascii')
+    profile_dir = profile_dir or CHROME_PROFILE_DIR
 
-def render_html_to_png(html_content: str, output_path: Path) -> bool:
-    """Render HTML to PNG using Chrome headless."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-        f.write(html_content)
-        html_path = f.name
-    
     try:
+        profile_dir.mkdir(parents=True, exist_ok=True)
         cmd = [
             CHROME_PATH,
             '--headless=new',
-            '--disable-gpu',
-            '--disable-software-rasterizer',
+            *GPU_FLAGS,
+            f'--user-data-dir={profile_dir}',
+            f'--disk-cache-dir={profile_dir / "cache"}',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-sync',
+            '--disable-default-apps',
+            '--mute-audio',
             f'--screenshot={output_path}',
             f'--window-size={WIDTH},{HEIGHT}',
             '--hide-scrollbars',
             '--default-background-color=00000000',
-            f'file://{html_path}'
+            url
         ]
         
         result = subprocess.run(
@@ -79,26 +164,190 @@ def render_html_to_png(html_content: str, output_path: Path) -> bool:
     except Exception as e:
         print(f"  ⚠️  Chrome render error: {e}")
         return False
-    finally:
-        os.unlink(html_path)
 
 
+# Renders are independent of each other, so cap concurrency by cores only
+RENDER_POOL_SIZE = max(2, (os.cpu_count() or 4) // 2)
+
+# Finished PNGs keyed by a hash of their HTML; identical cards (re-runs,
+# the CTA card day over day) are copied from here instead of re-rendered
+RENDER_CACHE_DIR = OUTPUT_DIR / ".render_cache"
+
+
+def _render_cache_path(html_content: str) -> Path:
+    digest = hashlib.sha1(html_content.encode('utf-8')).hexdigest()
+    return RENDER_CACHE_DIR / f"{digest}.png"
+
+
+def _content_card_cache_path(ver: str, category: str, item: dict, date_str: str, card_num: int) -> Path:
+    """Cache path for a content card, keyed on its inputs.
+
+    Hashing the fields that feed the template (rather than the finished
+    HTML) lets an unchanged card skip the template render too.
+    """
+    parts = (CARD_TEMPLATE_MAP.get(ver, 'card_v5'), category, str(card_num),
+             date_str, item.get('url', ''), item.get('title', ''),
+             item.get('description', ''))
+    digest = hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+    return RENDER_CACHE_DIR / f"{digest}.png"
+
+
+class _PlaywrightRenderer:
+    """Renders cards through one persistent headless browser.
+
+    All cards in a batch share a small pool of pages and render
+    concurrently; each page is reused via set_content instead of being
+    opened and closed per card.
+    """
+
+    def render_many(self, jobs):
+        """Render [(html_content, output_path)] jobs; returns per-job bools."""
+        import asyncio
+        return asyncio.run(self._render_many(jobs))
+
+    async def _render_many(self, jobs):
+        import asyncio
+        results = [False] * len(jobs)
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch()
+            pages = asyncio.Queue()
+            for _ in range(min(RENDER_POOL_SIZE, len(jobs))):
+                await pages.put(await browser.new_page(
+                    viewport={'width': WIDTH, 'height': HEIGHT}))
+
+            async def render_one(i, html_content, output_path):
+                page = await pages.get()
+                try:
+                    await page.set_content(html_content)
+                    # Screenshot to memory and write once - skips Chrome's
+                    # own write plus gives us the bytes without re-reading
+                    png_bytes = await page.screenshot(omit_background=True)
+                    output_path.write_bytes(png_bytes)
+                    results[i] = True
+                except Exception as e:
+                    print(f"  ⚠️  Render error: {e}")
+                finally:
+                    pages.put_nowait(page)
+
+            await asyncio.gather(*(render_one(i, html, path)
+                                   for i, (html, path) in enumerate(jobs)))
+            await browser.close()
+        return results
+
+
+class _ChromeRenderer:
+    """Fallback: one Chrome subprocess per card, run in parallel.
+
+    Each slot in the thread pool gets its own profile dir so concurrent
+    Chromes don't fight over the profile lock.
+    """
+
+    def render_many(self, jobs):
+        """Render [(html_content, output_path)] jobs; returns per-job bools."""
+        if not jobs:
+            return []
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        local = threading.local()
+
+        def render_one(job):
+            profile = getattr(local, 'profile', None)
+            if profile is None:
+                profile = local.profile = Path(
+                    f"{CHROME_PROFILE_DIR}-{threading.get_ident()}")
+            html, path = job
+            return render_html_to_png(html, path, profile_dir=profile)
+
+        with ThreadPoolExecutor(max_workers=RENDER_POOL_SIZE) as ex:
+            return list(ex.map(render_one, jobs))
+
+
+def make_renderer():
+    """Pick the best available card renderer."""
+    if HAVE_PLAYWRIGHT:
+        return _PlaywrightRenderer()
+    return _ChromeRenderer()
+
+
+# Dynamic text placement for static cards, matching each template's CSS.
+# A card only takes the Pillow path when templates/<name>_bg.png exists
+# (export one by rendering the template with its placeholder blank).
+STATIC_CARD_TEXT = {
+    'intro_v5': {'pos': (WIDTH // 2, 760), 'size': 48, 'fill': '#ffffff'},
+    'cta_v5': {'pos': (WIDTH // 2, 1140), 'size': 18, 'fill': '#00f0ff'},
+}
+
+
+def render_static_card(template_name: str, text: str, output_path: Path) -> bool:
+    """Composite a static card from its background PNG, if one is available.
+
+    The intro and CTA cards only vary by one line of text, so overlaying it
+    on a baked background skips the browser entirely for those two cards.
+    Returns False when Pillow or the background asset is missing.
+    """
+    style = STATIC_CARD_TEXT.get(template_name)
+    bg_path = TEMPLATES_DIR / f"{template_name}_bg.png"
+    if not (HAVE_PIL and style and bg_path.exists()):
+        return False
+    try:
+        img = Image.open(bg_path).convert('RGBA')
+        draw = ImageDraw.Draw(img)
+        try:
+            font = ImageFont.truetype('Georgia.ttf', style['size'])
+        except OSError:
+            font = ImageFont.load_default(style['size'])
+        draw.text(style['pos'], text, font=font, fill=style['fill'], anchor='mm')
+        img.save(output_path)
+        return output_path.exists()
+    except Exception as e:
+        print(f"  ⚠️  Pillow render error: {e}")
+        return False
+
+
+@functools.lru_cache(maxsize=None)
 def load_template(name: str) -> str:
-    """Load an HTML template."""
+    """Load an HTML template (cached - the same file is used by every card)."""
     template_path = TEMPLATES_DIR / f"{name}.html"
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
     return template_path.read_text()
 
 
+@functools.lru_cache(maxsize=None)
+def compile_template(name: str):
+    """Split a template into literal/placeholder segments, once per template.
+
+    re.split with a capturing group leaves placeholder names at the odd
+    indices, so substitution is a single join instead of one full-string
+    .replace scan per placeholder.
+    """
+    return re.split(r'\{\{(\w+)\}\}', load_template(name))
+
+
+def render_template(name: str, values: dict) -> str:
+    """Fill a precompiled template in one pass; missing values render empty."""
+    return ''.join(values.get(seg, '') if i % 2 else seg
+                   for i, seg in enumerate(compile_template(name)))
+
+
+# Translation tables do the whole escape in one C-level pass instead of
+# html.escape's five chained .replace scans (plus one more for newlines)
+_ESC_TABLE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;',
+})
+_ESC_TABLE_BR = {**_ESC_TABLE, ord('\n'): '<br>'}
+
+# Pulls the display domain out of a URL in one match; far lighter than
+# urlparse building a full ParseResult per card
+_DOMAIN_RE = re.compile(r'^https?://(?:www\.)?([^/]+)', re.I)
+
+
 def escape_html(text: str, preserve_newlines: bool = False) -> str:
     """Escape HTML special characters, optionally preserving newlines as <br>."""
     if not text:
         return ''
-    escaped = html.escape(text)
-    if preserve_newlines:
-        escaped = escaped.replace('\n', '<br>')
-    return escaped
+    return text.translate(_ESC_TABLE_BR if preserve_newlines else _ESC_TABLE)
 
 
 def truncate(text: str, max_len: int) -> str:
@@ -113,81 +362,77 @@ def truncate(text: str, max_len: int) -> str:
 def create_content_card(category: str, item: dict, date_str: str, card_num: int, version: str = None) -> str:
     """Create HTML for a content card."""
     ver = version or TEMPLATE_VERSION
-    template_map = {'v1': 'card', 'v2': 'card_v2', 'v3': 'card_v3', 'v4': 'card_v4', 'v5': 'card_v5'}
-    template_name = template_map.get(ver, 'card_v5')
-    template = load_template(template_name)
-    config = CATEGORIES.get(category, {'name': category.upper(), 'emoji': '📌', 'name_v2': category.title()})
-    
+    template_name = CARD_TEMPLATE_MAP.get(ver, 'card_v5')
+    emoji, cat_name = CARD_CONFIG.get(
+        (category, ver),
+        ('📌', category.upper() if ver == 'v1' else category.title()))
+
     # Extract domain from URL
     url = item.get('url', '')
-    try:
-        domain = urlparse(url).netloc.replace('www.', '')
-    except:
-        domain = url[:40] if url else 'unknown'
+    m = _DOMAIN_RE.match(url)
+    domain = m.group(1) if m else (url[:40] if url else 'unknown')
     
     # Prepare content - allow longer descriptions
     title = truncate(item.get('title', 'Unknown'), 150)
     description = item.get('description', '')  # Don't truncate bullet points
     
-    # Category name based on version
-    cat_name = config['name'] if ver == 'v1' else config.get('name_v2', config['name'])
-    
-    # Replace placeholders
-    html_content = template.replace('{{CATEGORY}}', category)
-    html_content = html_content.replace('{{NUMBER}}', str(card_num))
-    html_content = html_content.replace('{{EMOJI}}', config['emoji'])
-    html_content = html_content.replace('{{CATEGORY_NAME}}', cat_name)
-    html_content = html_content.replace('{{TITLE}}', escape_html(title))
-    html_content = html_content.replace('{{DESCRIPTION}}', escape_html(description, preserve_newlines=True))
-    html_content = html_content.replace('{{DOMAIN}}', escape_html(domain))
-    html_content = html_content.replace('{{DATE}}', date_str)
-    
-    return html_content
+    # Fill placeholders in a single pass over the precompiled segments
+    return render_template(template_name, {
+        'CATEGORY': category,
+        'NUMBER': str(card_num),
+        'EMOJI': emoji,
+        'CATEGORY_NAME': cat_name,
+        'TITLE': escape_html(title),
+        'DESCRIPTION': escape_html(description, preserve_newlines=True),
+        'DOMAIN': escape_html(domain),
+        'DATE': date_str,
+    })
 
 
-def create_intro_card(date_str: str, version: str = None) -> str:
-    """Create HTML for the intro card."""
-    ver = version or TEMPLATE_VERSION
-    template_map = {'v1': 'intro', 'v2': 'intro_v2', 'v3': 'intro_v3', 'v4': 'intro_v4', 'v5': 'intro_v5'}
-    template_name = template_map.get(ver, 'intro_v5')
-    template = load_template(template_name)
-    
-    # Format date nicely
+def format_display_date(date_str: str) -> str:
+    """Format a YYYY-MM-DD date for display on cards."""
     try:
         dt = datetime.strptime(date_str, '%Y-%m-%d')
-        formatted_date = dt.strftime('%B %d, %Y')
+        return dt.strftime('%B %d, %Y')
     except:
-        formatted_date = date_str
-    
-    return template.replace('{{DATE}}', formatted_date)
+        return date_str
+
+
+def create_intro_card(date_str: str, version: str = None) -> str:
+    """Create HTML for the intro card."""
+    ver = version or TEMPLATE_VERSION
+    template_name = INTRO_TEMPLATE_MAP.get(ver, 'intro_v5')
+    return render_template(template_name, {'DATE': format_display_date(date_str)})
 
 
 def create_cta_card(substack_url: str = "ai-digest.substack.com", version: str = None) -> str:
     """Create HTML for the CTA card."""
     ver = version or TEMPLATE_VERSION
-    template_map = {'v1': 'cta', 'v2': 'cta_v2', 'v3': 'cta_v3', 'v4': 'cta_v4', 'v5': 'cta_v5'}
-    template_name = template_map.get(ver, 'cta_v5')
-    template = load_template(template_name)
-    return template.replace('{{SUBSTACK_URL}}', substack_url)
+    template_name = CTA_TEMPLATE_MAP.get(ver, 'cta_v5')
+    return render_template(template_name, {'SUBSTACK_URL': substack_url})
+
 
+def generate_all_cards(date_str: str = None, include_intro: bool = True, include_cta: bool = True, version: str = None, data: dict = None):
+    """Generate all carousel cards for a given date.
 
-def generate_all_cards(date_str: str = None, include_intro: bool = True, include_cta: bool = True, version: str = None):
-    """Generate all carousel cards for a given date."""
+    If `data` is given it is used directly; otherwise data.json for the date
+    is read from disk (lets the orchestrator parse it once for all stages).
+    """
     if date_str is None:
         date_str = datetime.now().strftime("%Y-%m-%d")
-    
+
     ver = version or TEMPLATE_VERSION
     print(f"📐 Using template version: {ver}")
-    
-    data_file = OUTPUT_DIR / date_str / "data.json"
-    if not data_file.exists():
-        print(f"Error: No data file found for {date_str}")
-        print(f"Run fetch_all.py first")
-        sys.exit(1)
-    
-    with open(data_file) as f:
-        data = json.load(f)
-    
+
+    if data is None:
+        data_file = OUTPUT_DIR / date_str / "data.json"
+        if not data_file.exists():
+            print(f"Error: No data file found for {date_str}")
+            print(f"Run fetch_all.py first")
+            sys.exit(1)
+
+        data = json_loads(data_file.read_bytes())
+
     selected = data.get('selected', {})
     if not selected:
         print("Error: No selected items in data")
@@ -197,54 +442,83 @@ def generate_all_cards(date_str: str = None, include_intro: bool = True, include
     cards_dir = OUTPUT_DIR / date_str / "carousel"
     cards_dir.mkdir(parents=True, exist_ok=True)
     
-    created = []
+    # Build every card's HTML first, then hand the whole batch to the
+    # renderer so independent renders can run concurrently. Static cards
+    # with a baked background bypass the browser via render_static_card,
+    # and content cards whose inputs are unchanged come from the cache
+    # without even a template render.
+    RENDER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    jobs = []  # (label, html_content, card_path, cache_path)
+    pre_rendered = []  # (label, card_path) done without the browser
     card_num = 0
-    
-    # Intro card
+
     if include_intro:
         card_num += 1
         print(f"🎨 Creating card {card_num}: intro")
-        html_content = create_intro_card(date_str, ver)
-        card_path = cards_dir / f"{card_num:02d}_intro.png"
-        if render_html_to_png(html_content, card_path):
-            created.append(str(card_path))
-            print(f"  ✓ Saved {card_path.name}")
+        intro_path = cards_dir / f"{card_num:02d}_intro.png"
+        if render_static_card(INTRO_TEMPLATE_MAP.get(ver, 'intro_v5'),
+                              format_display_date(date_str), intro_path):
+            pre_rendered.append(('intro', intro_path))
         else:
-            print(f"  ✗ Failed to render intro card")
-    
-    # Content cards
+            html_content = create_intro_card(date_str, ver)
+            jobs.append(('intro', html_content, intro_path,
+                         _render_cache_path(html_content)))
+
     for category in CATEGORY_ORDER:
         if category not in selected:
             print(f"⚠️  Skipping {category} (no data)")
             continue
-        
+
         card_num += 1
-        item = selected[category]
         print(f"🎨 Creating card {card_num}: {category}")
-        
+
         # For content cards, number shows position (after intro if present)
         display_num = card_num if not include_intro else card_num - 1
-        html_content = create_content_card(category, item, date_str, display_num, ver)
         card_path = cards_dir / f"{card_num:02d}_{category}.png"
-        
-        if render_html_to_png(html_content, card_path):
-            created.append(str(card_path))
-            print(f"  ✓ Saved {card_path.name}")
-        else:
-            print(f"  ✗ Failed to render {category} card")
-    
-    # CTA card
+        cache_path = _content_card_cache_path(ver, category, selected[category], date_str, display_num)
+        if cache_path.exists():
+            shutil.copyfile(cache_path, card_path)
+            pre_rendered.append((category, card_path))
+            continue
+        html_content = create_content_card(category, selected[category], date_str, display_num, ver)
+        jobs.append((category, html_content, card_path, cache_path))
+
     if include_cta:
         card_num += 1
         print(f"🎨 Creating card {card_num}: cta")
-        html_content = create_cta_card(version=ver)
-        card_path = cards_dir / f"{card_num:02d}_cta.png"
-        if render_html_to_png(html_content, card_path):
+        cta_path = cards_dir / f"{card_num:02d}_cta.png"
+        if render_static_card(CTA_TEMPLATE_MAP.get(ver, 'cta_v5'),
+                              "ai-digest.substack.com", cta_path):
+            pre_rendered.append(('cta', cta_path))
+        else:
+            html_content = create_cta_card(version=ver)
+            jobs.append(('cta', html_content, cta_path,
+                         _render_cache_path(html_content)))
+
+    # Serve unchanged cards straight from the render cache
+    to_render = []
+    for label, html_content, card_path, cache_path in jobs:
+        if cache_path.exists():
+            shutil.copyfile(cache_path, card_path)
+            pre_rendered.append((label, card_path))
+        else:
+            to_render.append((label, html_content, card_path, cache_path))
+
+    renderer = make_renderer()
+    rendered = renderer.render_many([(html, path) for _, html, path, _ in to_render])
+
+    created = []
+    for label, card_path in pre_rendered:
+        created.append(str(card_path))
+        print(f"  ✓ Saved {card_path.name} (cached)")
+    for (label, _html, card_path, cache_path), ok in zip(to_render, rendered):
+        if ok:
+            shutil.copyfile(card_path, cache_path)
             created.append(str(card_path))
             print(f"  ✓ Saved {card_path.name}")
         else:
-            print(f"  ✗ Failed to render CTA card")
-    
+            print(f"  ✗ Failed to render {label} card")
+
     print(f"\n✅ Created {len(created)} cards in {cards_dir}")
     return created
 
@@ -8,6 +8,17 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+# orjson parses data.json several times faster than stdlib json; fall back
+# when not installed
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent
 OUTPUT_DIR = SKILL_DIR / "output"
@@ -23,9 +34,13 @@ CATEGORY_META = {
     'github_repos': {'name': 'GitHub Repo', 'emoji': '🔥', 'tagline': 'What to explore'},
 }
 
-CATEGORY_ORDER = ['ai_news', 'ai_discourse', 'model_releases', 'ai_tools', 
+CATEGORY_ORDER = ['ai_news', 'ai_discourse', 'model_releases', 'ai_tools',
                   'product_hunt', 'ai_papers', 'ai_funding', 'github_repos']
 
+# Shared fallback for categories missing from CATEGORY_META; hoisted so the
+# loop doesn't build a throwaway dict per iteration
+_DEFAULT_META = {'name': '', 'emoji': '📌', 'tagline': ''}
+
 
 def format_date(date_str):
     """Format date for display."""
@@ -33,19 +48,23 @@ def format_date(date_str):
     return dt.strftime("%B %d, %Y")
 
 
-def generate_article(date_str=None):
-    """Generate Substack article markdown."""
+def generate_article(date_str=None, data=None):
+    """Generate Substack article markdown.
+
+    If `data` is given it is used directly; otherwise data.json for the date
+    is read from disk (lets the orchestrator parse it once for all stages).
+    """
     if date_str is None:
         date_str = datetime.now().strftime("%Y-%m-%d")
-    
-    data_file = OUTPUT_DIR / date_str / "data.json"
-    if not data_file.exists():
-        print(f"Error: No data file found for {date_str}")
-        sys.exit(1)
-    
-    with open(data_file) as f:
-        data = json.load(f)
-    
+
+    if data is None:
+        data_file = OUTPUT_DIR / date_str / "data.json"
+        if not data_file.exists():
+            print(f"Error: No data file found for {date_str}")
+            sys.exit(1)
+
+        data = json_loads(data_file.read_bytes())
+
     selected = data.get('selected', {})
     categories = data.get('categories', {})
     
@@ -63,34 +82,31 @@ def generate_article(date_str=None):
     lines.append("")
     
     # Each category
+    append = lines.append
     num = 1
     for cat in CATEGORY_ORDER:
         if cat not in selected:
             continue
-        
+
         item = selected[cat]
-        meta = CATEGORY_META.get(cat, {'name': cat, 'emoji': '📌', 'tagline': ''})
-        
-        lines.append(f"## {num}. {meta['emoji']} {meta['name']}")
-        lines.append(f"*{meta['tagline']}*")
-        lines.append("")
-        lines.append(f"### [{item['title']}]({item['url']})")
-        lines.append("")
-        
+        meta = CATEGORY_META.get(cat, _DEFAULT_META)
+
+        append(f"## {num}. {meta['emoji']} {meta['name'] or cat}\n"
+               f"*{meta['tagline']}*\n"
+               f"\n"
+               f"### [{item['title']}]({item['url']})\n")
+
         if item.get('description'):
-            lines.append(item['description'])
-            lines.append("")
-        
+            append(f"{item['description']}\n")
+
         # Add runner-ups if available
         cat_items = categories.get(cat, [])
         if len(cat_items) > 1:
-            lines.append("**Also trending:**")
-            for runner in cat_items[1:4]:  # Next 3
-                lines.append(f"- [{runner['title']}]({runner['url']})")
-            lines.append("")
-        
-        lines.append("---")
-        lines.append("")
+            append("**Also trending:**\n" + "\n".join(
+                f"- [{runner['title']}]({runner['url']})"
+                for runner in cat_items[1:4]) + "\n")  # Next 3
+
+        append("---\n")
         num += 1
     
     # Footer
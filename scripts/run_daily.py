@@ -4,53 +4,74 @@ AI Digest - Daily orchestrator
 Runs the full pipeline: fetch → generate cards → generate article
 """
 
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
 SCRIPT_DIR = Path(__file__).parent
-VENV_PYTHON = SCRIPT_DIR.parent / ".venv" / "bin" / "python3"
-
-def run_script(script_name, date_str=None):
-    """Run a script with optional date argument."""
-    script_path = SCRIPT_DIR / script_name
-    cmd = [str(VENV_PYTHON), str(script_path)]
-    if date_str:
-        cmd.append(date_str)
-    
+sys.path.insert(0, str(SCRIPT_DIR))
+
+# The stages are plain modules in this directory; calling them in-process
+# skips an interpreter cold start per stage and shares warm imports
+from fetch_all import json_loads, main as fetch_main
+from generate_cards import generate_all_cards
+from generate_substack import generate_article
+
+def run_stage(name, fn, *args, **kwargs):
+    """Run one pipeline stage in-process; returns True on success."""
     print(f"\n{'='*60}")
-    print(f"Running: {script_name}")
+    print(f"Running: {name}")
     print(f"{'='*60}\n")
-    
-    result = subprocess.run(cmd, capture_output=False)
-    return result.returncode == 0
+
+    try:
+        fn(*args, **kwargs)
+        return True
+    except SystemExit as e:
+        # The stage scripts signal fatal errors with sys.exit
+        return not e.code
+    except Exception as e:
+        print(f"❌ {name} error: {e}", file=sys.stderr)
+        return False
 
 def main():
     date_str = sys.argv[1] if len(sys.argv) > 1 else datetime.now().strftime("%Y-%m-%d")
-    
+
     print(f"\n🚀 AI Digest Pipeline - {date_str}")
     print(f"{'='*60}")
-    
+
     # Step 1: Fetch all data
-    if not run_script("fetch_all.py", date_str):
+    if not run_stage("fetch_all", fetch_main):
         print("❌ Fetch failed")
         sys.exit(1)
-    
-    # Step 2: Generate carousel cards
-    if not run_script("generate_cards.py", date_str):
+
+    # Parse data.json once and hand it to both generators
+    data_file = SCRIPT_DIR.parent / "output" / date_str / "data.json"
+    if not data_file.exists():
+        print(f"❌ No data file found for {date_str}")
+        sys.exit(1)
+    data = json_loads(data_file.read_bytes())
+
+    # Steps 2+3: cards and the Substack article both only need the fetched
+    # data, so run them concurrently - Chrome CPU time overlaps markdown
+    # generation
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        cards_future = ex.submit(run_stage, "generate_cards", generate_all_cards, date_str, data=data)
+        substack_future = ex.submit(run_stage, "generate_substack", generate_article, date_str, data=data)
+        cards_ok = cards_future.result()
+        substack_ok = substack_future.result()
+
+    if not cards_ok:
         print("❌ Card generation failed")
         sys.exit(1)
-    
-    # Step 3: Generate Substack article
-    if not run_script("generate_substack.py", date_str):
+    if not substack_ok:
         print("❌ Substack generation failed")
         sys.exit(1)
-    
+
     print(f"\n{'='*60}")
     print(f"✅ AI Digest pipeline complete for {date_str}")
     print(f"{'='*60}")
-    
+
     # Summary
     output_dir = SCRIPT_DIR.parent / "output" / date_str
     print(f"\nOutputs:")